@@ -305,6 +305,14 @@ _UNKNOWN_TYPE = "<unknown>"
 # sentinel value to signal lack of a match
 not_found = object()
 
+# Regular expressions used on every completion request, compiled once at
+# import time instead of inside the matchers that use them.
+_SNAKE_CASE_RE = re.compile(r"[^_]+(_[^_]+)+?\Z")
+_ATTR_EXPR_RE = re.compile(r"(.+)\.(\w*)$")
+_DUNDER_ATTR_RE = re.compile(r".*\.__.*?__")
+_PRIVATE_ATTR_RE = re.compile(r"\._.*?")
+_DICT_KEY_QUOTE_RE = re.compile("(?:\"|')")
+
 class ProvisionalCompleterWarning(FutureWarning):
     """
     Exception raise by an experimental feature in this module.
@@ -368,15 +376,18 @@ def has_open_quotes(s):
         return False
 
 
+_PROTECTABLES_SET = frozenset(PROTECTABLES)
+
+
 def protect_filename(s, protectables=PROTECTABLES):
     """Escape a string to protect certain characters."""
-    if set(s) & set(protectables):
-        if sys.platform == "win32":
-            return '"' + s + '"'
-        else:
-            return "".join(("\\" + c if c in protectables else c) for c in s)
-    else:
+    prot = _PROTECTABLES_SET if protectables is PROTECTABLES else frozenset(protectables)
+    if prot.isdisjoint(s):
+        # common case: nothing to escape
         return s
+    if sys.platform == "win32":
+        return '"' + s + '"'
+    return "".join(("\\" + c if c in prot else c) for c in s)
 
 
 def expand_user(path:str) -> Tuple[str, bool, str]:
@@ -1114,12 +1125,11 @@ class Completer(Configurable):
                 if word[:n] == text and word != "__builtins__":
                     match_append(word)
 
-        snake_case_re = re.compile(r"[^_]+(_[^_]+)+?\Z")
         for lst in [list(self.namespace.keys()), list(self.global_namespace.keys())]:
             shortened = {
                 "_".join([sub[0] for sub in word.split("_")]): word
                 for word in lst
-                if snake_case_re.match(word)
+                if _SNAKE_CASE_RE.match(word)
             }
             for word in shortened.keys():
                 if word[:n] == text and word != "__builtins__":
@@ -1142,7 +1152,7 @@ class Completer(Configurable):
         return self._attr_matches(text)[0]
 
     def _attr_matches(self, text, include_prefix=True) -> Tuple[Sequence[str], str]:
-        m2 = re.match(r"(.+)\.(\w*)$", self.line_buffer)
+        m2 = _ATTR_EXPR_RE.match(self.line_buffer)
         if not m2:
             return [], ""
         expr, attr = m2.group(1, 2)
@@ -1392,7 +1402,7 @@ def match_dict_keys(
     if not prefix:
         return "", 0, {repr(k): v for k, v in filtered_key_is_final.items()}
 
-    quote_match = re.search("(?:\"|')", prefix)
+    quote_match = _DICT_KEY_QUOTE_RE.search(prefix)
     is_user_prefix_numeric = False
 
     if quote_match:
@@ -2336,11 +2346,11 @@ class IPCompleter(Completer):
                 if text.endswith(".") and self.omit__names:
                     if self.omit__names == 1:
                         # true if txt is _not_ a __ name, false otherwise:
-                        no__name = lambda txt: re.match(r".*\.__.*?__", txt) is None
+                        no__name = lambda txt: _DUNDER_ATTR_RE.match(txt) is None
                     else:
                         # true if txt is _not_ a _ name, false otherwise:
                         no__name = (
-                            lambda txt: re.match(r"\._.*?", txt[txt.rindex(".") :])
+                            lambda txt: _PRIVATE_ATTR_RE.match(txt[txt.rindex(".") :])
                             is None
                         )
                     matches = filter(no__name, matches)
@@ -2369,11 +2379,11 @@ class IPCompleter(Completer):
                     if self.omit__names == 1:
                         # true if txt is _not_ a __ name, false otherwise:
                         no__name = (lambda txt:
-                                    re.match(r'.*\.__.*?__',txt) is None)
+                                    _DUNDER_ATTR_RE.match(txt) is None)
                     else:
                         # true if txt is _not_ a _ name, false otherwise:
                         no__name = (lambda txt:
-                                    re.match(r'\._.*?',txt[txt.rindex('.'):]) is None)
+                                    _PRIVATE_ATTR_RE.match(txt[txt.rindex('.'):]) is None)
                     matches = filter(no__name, matches)
             except NameError:
                 # catches <undefined attributes>.<tab>
@@ -258,8 +258,9 @@ def module_completion(line):
         mod = words[1].split('.')
         if len(mod) < 2:
             return get_root_modules()
-        completion_list = try_import('.'.join(mod[:-1]), True)
-        return ['.'.join(mod[:-1] + [el]) for el in completion_list]
+        prefix = '.'.join(mod[:-1])
+        completion_list = try_import(prefix, True)
+        return [prefix + '.' + el for el in completion_list]
 
     # 'from xyz import abc<tab>'
     if nwords >= 3 and words[0] == 'from':
@@ -354,8 +354,10 @@ def update_class(old, new):
         except (AttributeError, TypeError):
             pass  # skip non-writable attributes
 
-    for key in list(new.__dict__.keys()):
-        if key not in list(old.__dict__.keys()):
+    # new is not mutated here, so no snapshot is needed; membership goes
+    # against the dict itself rather than an O(n) list of its keys
+    for key in new.__dict__:
+        if key not in old.__dict__:
             try:
                 setattr(old, key, getattr(new, key))
             except (AttributeError, TypeError):
@@ -376,18 +378,14 @@ def isinstance2(a, b, typ):
     return isinstance(a, typ) and isinstance(b, typ)
 
 
-UPDATE_RULES = [
+UPDATE_RULES = (
     (lambda a, b: isinstance2(a, b, type), update_class),
     (lambda a, b: isinstance2(a, b, types.FunctionType), update_function),
     (lambda a, b: isinstance2(a, b, property), update_property),
-]
-UPDATE_RULES.extend(
-    [
-        (
-            lambda a, b: isinstance2(a, b, types.MethodType),
-            lambda a, b: update_function(a.__func__, b.__func__),
-        ),
-    ]
+    (
+        lambda a, b: isinstance2(a, b, types.MethodType),
+        lambda a, b: update_function(a.__func__, b.__func__),
+    ),
 )
 
 
@@ -407,7 +405,7 @@ class StrongRef:
         return self.obj
 
 
-mod_attrs = [
+mod_attrs = frozenset([
     "__name__",
     "__doc__",
     "__package__",
@@ -416,7 +414,7 @@ mod_attrs = [
     "__file__",
     "__cached__",
     "__builtins__",
-]
+])
 
 
 def append_obj(module, d, name, obj, autoload=False):
@@ -195,7 +195,7 @@ class Audio(DisplayObject):
         data = array.array('f', data)
 
         try:
-            max_abs_value = float(max([abs(x) for x in data]))
+            max_abs_value = float(max(abs(x) for x in data))
         except TypeError as e:
             raise TypeError('Only lists of mono audio are '
                 'supported if numpy is not installed') from e
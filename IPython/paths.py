@@ -89,11 +89,15 @@ def get_ipython_cache_dir() -> str:
     return ipdir
 
 
+# IPython's install location cannot change within a process; resolve it once
+# at import time instead of on every lookup.
+_ipython_package_dir = os.path.dirname(IPython.__file__)
+assert isinstance(_ipython_package_dir, str)
+
+
 def get_ipython_package_dir() -> str:
     """Get the base directory where IPython itself is installed."""
-    ipdir = os.path.dirname(IPython.__file__)
-    assert isinstance(ipdir, str)
-    return ipdir
+    return _ipython_package_dir
 
 
 def get_ipython_module_path(module_str):
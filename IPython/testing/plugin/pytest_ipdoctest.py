@@ -73,7 +73,7 @@ RUNNER_CLASS = None
 # Lazy definition of output checker class
 CHECKER_CLASS: Optional[Type["IPDoctestOutputChecker"]] = None
 
-pytest_version = tuple([int(part) for part in pytest.__version__.split(".")])
+pytest_version = tuple(int(part) for part in pytest.__version__.split("."))
 
 
 def pytest_addoption(parser: Parser) -> None:
@@ -35,6 +35,9 @@ class StrDispatch(object):
     def add_re(self, regex, obj, priority= 0 ):
         """ Adds a target regexp for dispatching """
 
+        # compile once at registration; re.compile passes through patterns
+        # that are already compiled
+        regex = re.compile(regex)
         chain = self.regexs.get(regex, CommandChainDispatcher())
         chain.add(obj,priority)
         self.regexs[regex] = chain
@@ -45,7 +48,7 @@ class StrDispatch(object):
             yield self.strs[key]
 
         for r, obj in self.regexs.items():
-            if re.match(r, key):
+            if r.match(key):
                 yield obj
             else:
                 # print("nomatch",key)  # dbg